@@ -1,101 +1,357 @@
 import json
 import os
 import re
+import sqlite3
+import subprocess
 import sys
 import time
-from datetime import datetime
-
-import yaml
-from playwright.sync_api import sync_playwright
+import urllib.request
+import weakref
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 CONFIG_PATH = os.getenv("CONFIG_PATH", "config.yaml")
 
+_RX_DATE_POSTED = re.compile("Date posted|Time posted", re.I)
+_RX_EASY_APPLY = re.compile("Easy Apply|Kolay", re.I)
+_RX_SHOW_RESULTS = re.compile("Show results|Apply", re.I)
+_RX_DISTANCE = re.compile("^Distance$", re.I)
+_RX_DISTANCE_SECTION = re.compile("Distance", re.I)
+_RX_ANY_DISTANCE = re.compile("Any distance|Any", re.I)
+_RX_ALL_FILTERS = re.compile("All filters", re.I)
+_RX_ALL_FILTERS_EXACT = re.compile("^All filters$", re.I)
+_RX_FILTERS_EXACT = re.compile("^Filters$", re.I)
+_RX_KNOWN_FILTERS = re.compile("All filters|Easy Apply", re.I)
+# Anchored: only a button that says just "Done" closes the post-submit screen
+_RX_DONE = re.compile(r"^\s*(Done|Bitti|Tamam)\s*$", re.I)
+# Modal action buttons, matched on their text like _MODAL_STATE_JS does
+_RX_SUBMIT = re.compile("submit", re.I)
+_RX_REVIEW = re.compile("review", re.I)
+_RX_NEXT = re.compile("next", re.I)
+_RX_FOLLOW = re.compile("follow", re.I)
+_RX_WHITESPACE = re.compile(r"\s+")
+# "applied ... ago" together with a minutes/hours amount, in a single match
+_RX_RECENTLY_APPLIED = re.compile(
+    r"^(?=.*\bapplied\b.*\bago\b)"
+    r"(?=.*(?:\b(?:\d+|a|an|few)\b.*\b(?:minute|minutes|hour|hours)\b|\b\d+\s*(?:m|h)\b))"
+)
+
 
 def load_config(path: str) -> dict:
-    if not os.path.exists(path):
+    import yaml
+
+    try:
+        f = open(path, "r", encoding="utf-8")
+    except FileNotFoundError:
         print(f"Config not found: {path}")
         sys.exit(1)
-    with open(path, "r", encoding="utf-8") as f:
+    with f:
         data = yaml.safe_load(f) or {}
     return data
 
 
 def load_state(path: str) -> dict:
-    if not os.path.exists(path):
+    try:
+        f = open(path, "r", encoding="utf-8")
+    except FileNotFoundError:
         return {"jobs": {}}
-    with open(path, "r", encoding="utf-8") as f:
+    with f:
         try:
             return json.load(f)
         except json.JSONDecodeError:
             return {"jobs": {}}
 
 
-def save_state(path: str, state: dict) -> None:
-    os.makedirs(os.path.dirname(path), exist_ok=True)
+def open_state_db(path: str):
+    # Older configs point at applied.json; keep the name, swap the extension
+    base, _ = os.path.splitext(path)
+    db_path = base + ".db"
+    os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+    is_new = not os.path.exists(db_path)
+    conn = sqlite3.connect(db_path)
+    # WAL appends each commit instead of rewriting pages in place; NORMAL
+    # skips the fsync per commit, a crash can only lose the last few jobs
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS jobs ("
+        "id TEXT PRIMARY KEY, status TEXT, title TEXT, company TEXT, url TEXT, updated_at TEXT)"
+    )
+    conn.commit()
+    if is_new:
+        imported = import_legacy_state(conn, base + ".json")
+        if imported:
+            print(f"Imported {imported} jobs from {base}.json")
+    return conn
+
+
+def import_legacy_state(conn, path: str) -> int:
+    jobs = load_state(path).get("jobs", {})
+    conn.executemany(
+        "INSERT OR IGNORE INTO jobs VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (
+                job_id,
+                record.get("status"),
+                record.get("title"),
+                record.get("company"),
+                record.get("url"),
+                record.get("updated_at"),
+            )
+            for job_id, record in jobs.items()
+        ],
+    )
+    conn.commit()
+    return len(jobs)
+
+
+def prune_job_records(conn, max_records: int, archive_path: str) -> int:
+    (count,) = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()
+    excess = count - max_records
+    if excess <= 0:
+        return 0
+    # INSERT OR REPLACE gives a touched row a new rowid, so the lowest rowids
+    # are the least recently updated jobs
+    rows = conn.execute(
+        "SELECT rowid, id, status, title, company, url, updated_at FROM jobs "
+        "ORDER BY rowid LIMIT ?",
+        (excess,),
+    ).fetchall()
+    # Append-only archive keeps the history without rewriting anything
+    os.makedirs(os.path.dirname(archive_path) or ".", exist_ok=True)
+    with open(archive_path, "a", encoding="utf-8") as f:
+        for _, job_id, status, title, company, url, updated_at in rows:
+            record = {
+                "id": job_id,
+                "status": status,
+                "title": title,
+                "company": company,
+                "url": url,
+                "updated_at": updated_at,
+            }
+            f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+    conn.executemany("DELETE FROM jobs WHERE rowid = ?", [(row[0],) for row in rows])
+    conn.commit()
+    return len(rows)
+
+
+def load_seen_ids(conn, skip_status: str = None) -> set:
+    if skip_status:
+        rows = conn.execute("SELECT id FROM jobs WHERE status IS NOT ?", (skip_status,))
+    else:
+        rows = conn.execute("SELECT id FROM jobs")
+    return {row[0] for row in rows}
+
+
+def record_job(conn, job_id: str, record: dict) -> None:
+    conn.execute(
+        "INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            job_id,
+            record["status"],
+            record["title"],
+            record["company"],
+            record["url"],
+            record["updated_at"],
+        ),
+    )
+    conn.commit()
+
+
+_LINKEDIN_URL = "https://www.linkedin.com"
+
+
+def has_linkedin_session(context) -> bool:
+    return any(c["name"] == "li_at" for c in context.cookies(_LINKEDIN_URL))
+
+
+def restore_storage_state(context, path: str) -> bool:
+    # A live session is newer than the saved one; never overwrite it
+    if has_linkedin_session(context):
+        return False
+    try:
+        f = open(path, "r", encoding="utf-8")
+    except FileNotFoundError:
+        return False
+    with f:
+        try:
+            cookies = json.load(f).get("cookies", [])
+        except json.JSONDecodeError:
+            return False
+    if not cookies:
+        return False
+    context.add_cookies(cookies)
+    return True
+
+
+def save_storage_state(context, path: str) -> None:
+    # The debug profile is shared with other sites; keep only LinkedIn's state
+    state = context.storage_state()
+    state["cookies"] = [
+        c for c in state.get("cookies", []) if c.get("domain", "").endswith("linkedin.com")
+    ]
+    state["origins"] = [
+        o for o in state.get("origins", [])
+        if (urlsplit(o.get("origin", "")).hostname or "").endswith("linkedin.com")
+    ]
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
     with open(path, "w", encoding="utf-8") as f:
-        json.dump(state, f, indent=2, sort_keys=True)
+        json.dump(state, f)
+
+
+_iso_cache = (0, "")
 
 
 def now_iso() -> str:
-    return datetime.now().isoformat(timespec="seconds")
+    # Timestamps have 1s resolution, so reuse the string within the same second
+    global _iso_cache
+    now = int(time.time())
+    if _iso_cache[0] != now:
+        _iso_cache = (now, time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(now)))
+    return _iso_cache[1]
+
+
+def cdp_endpoint_ready(cdp_url: str, timeout: float = 1.0) -> bool:
+    try:
+        with urllib.request.urlopen(cdp_url.rstrip("/") + "/json/version", timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def launch_debug_chrome(browser_config: dict, cdp_url: str) -> bool:
+    chrome_path = browser_config.get("chrome_path")
+    if not chrome_path:
+        return False
+    port = urlsplit(cdp_url).port or 9222
+    user_data_dir = browser_config.get("user_data_dir", "/tmp/chrome-linkedin-debug")
+    # Detached so Chrome outlives this run and the next run attaches to it
+    try:
+        subprocess.Popen(
+            [
+                chrome_path,
+                f"--remote-debugging-port={port}",
+                f"--user-data-dir={user_data_dir}",
+                "https://www.linkedin.com/jobs/",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError as e:
+        print(f"Could not start Chrome at {chrome_path} ({e})")
+        return False
+    end_time = time.time() + 15
+    while time.time() < end_time:
+        if cdp_endpoint_ready(cdp_url):
+            return True
+        time.sleep(0.5)
+    return False
 
 
-def find_jobs_page(browser):
-    for context in browser.contexts:
+def find_jobs_page(contexts):
+    for context in contexts:
         for page in context.pages:
             if "linkedin.com/jobs" in page.url:
                 return page
     return None
 
 
+def wait_for_visible(page, selector: str, timeout_ms: int) -> bool:
+    try:
+        page.wait_for_selector(selector, state="visible", timeout=timeout_ms)
+        return True
+    except Exception:
+        return False
+
+
+def wait_for_network_idle(page, timeout_ms: int) -> bool:
+    try:
+        page.wait_for_load_state("networkidle", timeout=timeout_ms)
+        return True
+    except Exception:
+        return False
+
+
+# Queries one comma-joined selector and walks the matches in the caller's
+# priority order in the browser, so a list of candidate selectors costs a
+# single round-trip instead of count() + is_visible() per candidate.
+_FIRST_VISIBLE_SELECTOR_JS = r"""
+(els, selectors) => {
+  const visible = (el) => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+  return selectors.findIndex((sel) => els.some((el) => el.matches(sel) && visible(el)));
+}
+"""
+
+
+def first_visible_selector(page, selectors):
+    idx = page.locator(", ".join(selectors)).evaluate_all(_FIRST_VISIBLE_SELECTOR_JS, selectors)
+    return selectors[idx] if idx >= 0 else None
+
+
+_FIRST_VISIBLE_INDEX_JS = (
+    "(els) => els.findIndex((el) => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length))"
+)
+
+
+def first_visible(locator):
+    # Unlike locator.first.is_visible(), also finds a visible match behind hidden ones
+    idx = locator.evaluate_all(_FIRST_VISIBLE_INDEX_JS)
+    return locator.nth(idx) if idx >= 0 else None
+
+
+_PRESENT_SELECTORS_JS = "(selectors) => selectors.filter((sel) => document.querySelector(sel))"
+
+
+def present_selectors(page, selectors):
+    # Existence of every candidate in one round-trip, in priority order
+    return page.evaluate(_PRESENT_SELECTORS_JS, list(selectors))
+
+
 def prompt_retry(message: str) -> None:
     print(message)
     input("Press Enter to retry...")
 
 
+_LOCATION_INPUT_SELECTOR = ", ".join([
+    "input[aria-label='City, state, or zip code']",
+    "input[aria-label='Location']",
+    "input[placeholder*='Location']",
+])
+_LOCATION_CLEAR_SELECTORS = [
+    "button[aria-label='Clear location']",
+    "button[aria-label='Clear']",
+    "button[aria-label='Clear search']",
+]
+_LOCATION_SUGGESTIONS_SELECTOR = "ul[role='listbox'] li, div[role='listbox'] li"
+
+
 def apply_location_filter(page, location: str) -> bool:
-    selectors = [
-        "input[aria-label='City, state, or zip code']",
-        "input[aria-label='Location']",
-        "input[placeholder*='Location']",
-    ]
-    input_box = None
-    for sel in selectors:
-        locator = page.locator(sel)
-        if locator.count() > 0:
-            input_box = locator.first
-            break
-    if not input_box:
+    input_box = page.locator(_LOCATION_INPUT_SELECTOR).first
+    if input_box.count() == 0:
         raise RuntimeError("Location input not found")
     # Clear existing value
-    clear_selectors = [
-        "button[aria-label='Clear location']",
-        "button[aria-label='Clear']",
-        "button[aria-label='Clear search']",
-    ]
     cleared = False
-    for sel in clear_selectors:
-        btn = page.locator(sel)
-        if btn.count() > 0 and btn.first.is_visible():
-            btn.first.click()
-            cleared = True
-            break
+    clear_sel = first_visible_selector(page, _LOCATION_CLEAR_SELECTORS)
+    clear_btn = first_visible(page.locator(clear_sel)) if clear_sel else None
+    if clear_btn:
+        # The first match can be a hidden duplicate; click the visible one
+        clear_btn.click()
+        cleared = True
     input_box.click()
     if not cleared:
-        # Try both macOS and Windows/Linux shortcuts
-        for combo in ("Meta+A", "Control+A"):
-            try:
-                input_box.press(combo)
-                input_box.press("Backspace")
-            except Exception:
-                pass
+        # ControlOrMeta resolves to Meta on macOS and Control elsewhere
+        try:
+            input_box.press("ControlOrMeta+A")
+            input_box.press("Backspace")
+        except Exception:
+            pass
 
-    input_box.fill("")
-    input_box.type(location, delay=25)
-    time.sleep(0.3)
+    # fill() replaces the value and fires the input event the autocomplete listens to
+    input_box.fill(location)
+    wait_for_visible(page, _LOCATION_SUGGESTIONS_SELECTOR, 2000)
 
     # Prefer selecting the exact suggestion when available
-    suggestions = page.locator("ul[role='listbox'] li, div[role='listbox'] li")
+    suggestions = page.locator(_LOCATION_SUGGESTIONS_SELECTOR)
     if suggestions.count() > 0:
         candidate_texts = [location]
         if location.lower() in ("türkiye", "turkiye"):
@@ -103,11 +359,12 @@ def apply_location_filter(page, location: str) -> bool:
         if location.lower() == "turkey":
             candidate_texts.append("Türkiye")
 
-        for candidate in candidate_texts:
-            match = suggestions.filter(has_text=re.compile(re.escape(candidate), re.I))
-            if match.count() > 0 and match.first.is_visible():
-                match.first.click()
-                return True
+        # One alternation picks the topmost suggestion matching any spelling
+        pattern = re.compile("|".join(re.escape(c) for c in candidate_texts), re.I)
+        match = suggestions.filter(has_text=pattern).first
+        if match.is_visible():
+            match.click()
+            return True
 
         # As a last resort, click the first suggestion
         if suggestions.first.is_visible():
@@ -118,7 +375,17 @@ def apply_location_filter(page, location: str) -> bool:
     return True
 
 
+# LinkedIn's f_TPR values, shared by the filters panel radios and the search URL
+_DATE_POSTED_VALUES = {
+    "past 24 hours": "r86400",
+    "past week": "r604800",
+    "past month": "r2592000",
+    "any time": "",
+}
+
+
 def apply_date_posted_filter(page, label: str, use_all_filters: bool) -> bool:
+    label_re = re.compile(label, re.I)
     # Prefer All filters panel when enabled
     if use_all_filters:
         print("date_posted: using All filters panel")
@@ -126,17 +393,11 @@ def apply_date_posted_filter(page, label: str, use_all_filters: bool) -> bool:
         if not panel:
             raise RuntimeError("Filters panel not found")
 
-        value_map = {
-            "past 24 hours": "r86400",
-            "past week": "r604800",
-            "past month": "r2592000",
-            "any time": "",
-        }
         label_key = label.strip().lower()
-        value = value_map.get(label_key)
+        value = _DATE_POSTED_VALUES.get(label_key)
 
         date_section = panel.locator("fieldset").filter(
-            has_text=re.compile("Date posted|Time posted", re.I)
+            has_text=_RX_DATE_POSTED
         )
         if date_section.count() > 0:
             date_section.first.scroll_into_view_if_needed()
@@ -145,10 +406,10 @@ def apply_date_posted_filter(page, label: str, use_all_filters: bool) -> bool:
         label_loc = None
         if date_section.count() > 0:
             label_loc = date_section.locator("label").filter(
-                has_text=re.compile(label, re.I)
+                has_text=label_re
             )
         if label_loc is None or label_loc.count() == 0:
-            label_loc = panel.locator("label").filter(has_text=re.compile(label, re.I))
+            label_loc = panel.locator("label").filter(has_text=label_re)
 
         if label_loc.count() > 0:
             label_loc.first.click()
@@ -165,7 +426,7 @@ def apply_date_posted_filter(page, label: str, use_all_filters: bool) -> bool:
                     )
 
             if not option or option.count() == 0:
-                option = panel.get_by_label(re.compile(label, re.I))
+                option = panel.get_by_label(label_re)
 
             if option.count() == 0:
                 raise RuntimeError("Date posted option not found in filters panel")
@@ -181,13 +442,11 @@ def apply_date_posted_filter(page, label: str, use_all_filters: bool) -> bool:
     container = page.locator(
         "div.search-reusables__filter-trigger-and-dropdown[data-basic-filter-parameter-name='timePostedRange']"
     )
-    btn = None
-    if container.count() > 0:
-        btn = container.locator(
+    btn = first_visible(
+        container.locator(
             "button#searchFilter_timePostedRange, button[aria-label*='Date posted filter' i]"
         )
-        if btn.count() > 0:
-            btn = btn.first
+    )
 
     if not btn:
         btn = find_date_posted_button(page)
@@ -198,16 +457,15 @@ def apply_date_posted_filter(page, label: str, use_all_filters: bool) -> bool:
 
     print("date_posted: pill found")
     btn.click()
-    time.sleep(0.3)
+    dropdown_selector = "div[role='listbox'], ul[role='listbox'], div[role='menu'], ul[role='menu']"
+    wait_for_visible(page, dropdown_selector, 2000)
 
-    dropdown = page.locator(
-        "div[role='listbox'], ul[role='listbox'], div[role='menu'], ul[role='menu']"
-    )
-    option = dropdown.get_by_role("menuitemradio", name=re.compile(label, re.I))
+    dropdown = page.locator(dropdown_selector)
+    option = dropdown.get_by_role("menuitemradio", name=label_re)
     if option.count() == 0:
-        option = page.get_by_role("radio", name=re.compile(label, re.I))
+        option = page.get_by_role("radio", name=label_re)
     if option.count() == 0:
-        option = page.get_by_label(re.compile(label, re.I))
+        option = page.get_by_label(label_re)
 
     if option.count() == 0:
         raise RuntimeError("Date posted option not found in top bar")
@@ -221,12 +479,12 @@ def apply_date_posted_filter(page, label: str, use_all_filters: bool) -> bool:
 
 def apply_easy_apply_filter(page, use_all_filters: bool) -> bool:
     # Try direct filter button (top bar) first
-    btn = find_top_filter_button(page, re.compile("Easy Apply", re.I))
+    btn = find_top_filter_button(page, _RX_EASY_APPLY)
     if btn:
         pressed = btn.get_attribute("aria-pressed")
         if pressed != "true":
+            # The caller waits for the results to refresh
             btn.click()
-            time.sleep(0.3)
         return True
 
     if not use_all_filters:
@@ -235,8 +493,8 @@ def apply_easy_apply_filter(page, use_all_filters: bool) -> bool:
     panel = open_filters_panel(page)
     if not panel:
         raise RuntimeError("Filters panel not found")
-    ensure_filter_section(panel, re.compile("Easy Apply|Kolay", re.I))
-    checkbox = panel.get_by_role("checkbox", name=re.compile("Easy Apply|Kolay", re.I))
+    ensure_filter_section(panel, _RX_EASY_APPLY)
+    checkbox = panel.get_by_role("checkbox", name=_RX_EASY_APPLY)
     if checkbox.count() == 0:
         checkbox = panel.locator("label:has-text('Easy Apply') input[type='checkbox']")
     if checkbox.count() == 0:
@@ -244,7 +502,7 @@ def apply_easy_apply_filter(page, use_all_filters: bool) -> bool:
     if checkbox.count() == 0:
         # fallback: click the label/container that includes the text
         label = panel.locator("label, li, div").filter(
-            has_text=re.compile("Easy Apply|Kolay", re.I)
+            has_text=_RX_EASY_APPLY
         )
         if label.count() > 0:
             label.first.scroll_into_view_if_needed()
@@ -254,18 +512,18 @@ def apply_easy_apply_filter(page, use_all_filters: bool) -> bool:
     else:
         checkbox.first.scroll_into_view_if_needed()
         checkbox.first.check(force=True)
-    panel.get_by_role("button", name=re.compile("Show results|Apply", re.I)).first.click()
+    panel.get_by_role("button", name=_RX_SHOW_RESULTS).first.click()
     return True
 
 
 def clear_distance_filter(page, use_all_filters: bool) -> bool:
     # Prefer the top-level Distance filter if present
-    btn = find_top_filter_button(page, re.compile("^Distance$", re.I))
+    btn = find_top_filter_button(page, _RX_DISTANCE)
     if btn:
         btn.click()
-        option = page.get_by_role("radio", name=re.compile("Any distance|Any", re.I))
+        option = page.get_by_role("radio", name=_RX_ANY_DISTANCE)
         if option.count() == 0:
-            option = page.get_by_label(re.compile("Any distance|Any", re.I))
+            option = page.get_by_label(_RX_ANY_DISTANCE)
         if option.count() > 0:
             try:
                 option.first.check(force=True)
@@ -280,17 +538,17 @@ def clear_distance_filter(page, use_all_filters: bool) -> bool:
     if not panel:
         raise RuntimeError("Filters panel not found")
 
-    fieldset = ensure_filter_section(panel, re.compile("Distance", re.I))
+    fieldset = ensure_filter_section(panel, _RX_DISTANCE_SECTION)
     option = None
     if fieldset.count() > 0:
-        option = fieldset.get_by_role("radio", name=re.compile("Any distance|Any", re.I))
+        option = fieldset.get_by_role("radio", name=_RX_ANY_DISTANCE)
         if option.count() == 0:
-            option = fieldset.get_by_label(re.compile("Any distance|Any", re.I))
+            option = fieldset.get_by_label(_RX_ANY_DISTANCE)
 
     if not option or option.count() == 0:
-        option = panel.get_by_role("radio", name=re.compile("Any distance|Any", re.I))
+        option = panel.get_by_role("radio", name=_RX_ANY_DISTANCE)
         if option.count() == 0:
-            option = panel.get_by_label(re.compile("Any distance|Any", re.I))
+            option = panel.get_by_label(_RX_ANY_DISTANCE)
 
     if option.count() > 0:
         option.first.scroll_into_view_if_needed()
@@ -298,7 +556,7 @@ def clear_distance_filter(page, use_all_filters: bool) -> bool:
             option.first.check(force=True)
         except Exception:
             option.first.click(force=True)
-        apply_btn = panel.get_by_role("button", name=re.compile("Show results|Apply", re.I))
+        apply_btn = panel.get_by_role("button", name=_RX_SHOW_RESULTS)
         if apply_btn.count() > 0:
             apply_btn.first.click()
         return True
@@ -307,9 +565,9 @@ def clear_distance_filter(page, use_all_filters: bool) -> bool:
 
 def open_filters_panel(page):
     candidates = [
-        page.get_by_role("button", name=re.compile("^All filters$", re.I)),
-        page.get_by_role("button", name=re.compile("^Filters$", re.I)),
-        page.get_by_role("button", name=re.compile("All filters", re.I)),
+        page.get_by_role("button", name=_RX_ALL_FILTERS_EXACT),
+        page.get_by_role("button", name=_RX_FILTERS_EXACT),
+        page.get_by_role("button", name=_RX_ALL_FILTERS),
         page.locator("button[aria-label*='All filters' i]"),
         page.locator("button[aria-label*='Filters' i]"),
         page.locator("button[data-control-name='all_filters']"),
@@ -317,8 +575,9 @@ def open_filters_panel(page):
     clicked = False
     for loc in candidates:
         try:
-            if loc.count() > 0 and loc.first.is_visible():
-                loc.first.click()
+            btn = first_visible(loc)
+            if btn:
+                btn.click()
                 clicked = True
                 break
         except Exception:
@@ -327,18 +586,19 @@ def open_filters_panel(page):
     if not clicked:
         return None
 
-    time.sleep(0.5)
+    wait_for_visible(
+        page,
+        "div[role='dialog'], section[aria-label*='Filters' i], aside[aria-label*='Filters' i]",
+        3000,
+    )
     panel = page.locator("div[role='dialog']").filter(
-        has=page.get_by_role("button", name=re.compile("Show results|Apply", re.I))
+        has=page.get_by_role("button", name=_RX_SHOW_RESULTS)
     )
     if panel.count() > 0:
         return panel.first
 
     panel = page.locator("section[aria-label*='Filters' i], aside[aria-label*='Filters' i]")
-    if panel.count() > 0 and panel.first.is_visible():
-        return panel.first
-
-    return None
+    return first_visible(panel)
 
 
 def ensure_filter_section(panel, name_regex):
@@ -361,111 +621,110 @@ def ensure_filter_section(panel, name_regex):
     return fieldset
 
 
+_FILTER_BAR_SELECTORS = [
+    "ul.search-reusables__filter-list",
+    "ul.search-reusables__filters-list",
+    "div.search-reusables__filters-bar",
+    "div.jobs-search-filters__filter-list",
+    "div.jobs-search-filters__filters",
+    "div.jobs-search-filters__filters-bar",
+    "div.jobs-search-filters",
+    "section.jobs-search-filters",
+]
+
+
 def find_top_filter_button(page, name_regex):
-    containers = [
-        page.locator("ul.search-reusables__filter-list"),
-        page.locator("ul.search-reusables__filters-list"),
-        page.locator("div.search-reusables__filters-bar"),
-        page.locator("div.jobs-search-filters__filter-list"),
-        page.locator("div.jobs-search-filters__filters"),
-        page.locator("div.jobs-search-filters__filters-bar"),
-        page.locator("div.jobs-search-filters"),
-        page.locator("section.jobs-search-filters"),
-    ]
-    for container in containers:
-        if container.count() > 0:
-            btn = container.get_by_role("button", name=name_regex)
-            if btn.count() > 0 and btn.first.is_visible():
-                return btn.first
-            btn = container.locator("button, span, div").filter(has_text=name_regex)
-            if btn.count() > 0 and btn.first.is_visible():
-                candidate = btn.first
-                try:
-                    if candidate.get_attribute("role") != "button":
-                        ancestor = candidate.locator("xpath=ancestor::button[1]")
-                        if ancestor.count() > 0:
-                            return ancestor.first
-                        ancestor = candidate.locator("xpath=ancestor::*[@role='button'][1]")
-                        if ancestor.count() > 0:
-                            return ancestor.first
-                except Exception:
-                    pass
-                return candidate
-            text_match = container.get_by_text(name_regex)
-            if text_match.count() > 0 and text_match.first.is_visible():
-                candidate = text_match.first
-                try:
-                    ancestor = candidate.locator("xpath=ancestor-or-self::button[1]")
-                    if ancestor.count() > 0 and ancestor.first.is_visible():
+    for sel in present_selectors(page, _FILTER_BAR_SELECTORS):
+        container = page.locator(sel)
+        btn = container.get_by_role("button", name=name_regex)
+        if btn.first.is_visible():
+            return btn.first
+        btn = container.locator("button, span, div").filter(has_text=name_regex)
+        if btn.first.is_visible():
+            candidate = btn.first
+            try:
+                if candidate.get_attribute("role") != "button":
+                    ancestor = candidate.locator("xpath=ancestor::button[1]")
+                    if ancestor.count() > 0:
                         return ancestor.first
-                    ancestor = candidate.locator("xpath=ancestor-or-self::*[@role='button'][1]")
-                    if ancestor.count() > 0 and ancestor.first.is_visible():
+                    ancestor = candidate.locator("xpath=ancestor::*[@role='button'][1]")
+                    if ancestor.count() > 0:
                         return ancestor.first
-                except Exception:
-                    pass
-                return candidate
+            except Exception:
+                pass
+            return candidate
+        text_match = container.get_by_text(name_regex)
+        if text_match.first.is_visible():
+            candidate = text_match.first
+            try:
+                ancestor = candidate.locator("xpath=ancestor-or-self::button[1]")
+                if ancestor.first.is_visible():
+                    return ancestor.first
+                ancestor = candidate.locator("xpath=ancestor-or-self::*[@role='button'][1]")
+                if ancestor.first.is_visible():
+                    return ancestor.first
+            except Exception:
+                pass
+            return candidate
 
     btn = page.get_by_role("button", name=name_regex)
-    if btn.count() > 0 and btn.first.is_visible():
+    if btn.first.is_visible():
         return btn.first
     btn = page.locator("button[aria-label]").filter(has_text=name_regex)
-    if btn.count() > 0 and btn.first.is_visible():
+    if btn.first.is_visible():
         return btn.first
     btn = page.locator("button").filter(has_text=name_regex)
-    if btn.count() > 0 and btn.first.is_visible():
+    if btn.first.is_visible():
         return btn.first
     return None
 
 
+# Selector of the filters bar found per page. Locators re-resolve on use, so
+# the entry stays valid across result refreshes until the bar disappears.
+_filters_bar_selectors = weakref.WeakKeyDictionary()
+
+
 def find_filters_bar_container(page):
-    containers = [
-        page.locator("ul.search-reusables__filter-list"),
-        page.locator("ul.search-reusables__filters-list"),
-        page.locator("div.search-reusables__filters-bar"),
-        page.locator("div.jobs-search-filters__filter-list"),
-        page.locator("div.jobs-search-filters__filters"),
-        page.locator("div.jobs-search-filters__filters-bar"),
-        page.locator("div.jobs-search-filters"),
-        page.locator("section.jobs-search-filters"),
-    ]
-    for container in containers:
-        if container.count() == 0:
-            continue
+    cached = _filters_bar_selectors.get(page)
+    if cached:
+        container = page.locator(cached)
+        if container.count() > 0:
+            return container
+        del _filters_bar_selectors[page]
+    for sel in present_selectors(page, _FILTER_BAR_SELECTORS):
+        container = page.locator(sel)
         # Prefer containers that include a known filter like "All filters" or "Easy Apply"
         if (
-            container.get_by_role("button", name=re.compile("All filters|Easy Apply", re.I)).count()
-            > 0
-            or container.locator("button").filter(
-                has_text=re.compile("All filters|Easy Apply", re.I)
-            ).count()
-            > 0
+            container.get_by_role("button", name=_RX_KNOWN_FILTERS).count() > 0
+            or container.locator("button").filter(has_text=_RX_KNOWN_FILTERS).count() > 0
         ):
+            _filters_bar_selectors[page] = sel
             return container
     return None
 
 
 def find_date_posted_button(page):
-    name_regex = re.compile("Date posted|Time posted", re.I)
+    name_regex = _RX_DATE_POSTED
     container = find_filters_bar_container(page)
     if container:
         btn = container.get_by_role("button", name=name_regex)
-        if btn.count() > 0 and btn.first.is_visible():
+        if btn.first.is_visible():
             return btn.first
         btn = container.locator("[role='button']").filter(has_text=name_regex)
-        if btn.count() > 0 and btn.first.is_visible():
+        if btn.first.is_visible():
             return btn.first
         btn = container.locator("button").filter(has_text=name_regex)
-        if btn.count() > 0 and btn.first.is_visible():
+        if btn.first.is_visible():
             return btn.first
         btn = container.locator("span, div").filter(has_text=name_regex)
-        if btn.count() > 0 and btn.first.is_visible():
+        if btn.first.is_visible():
             candidate = btn.first
             try:
                 ancestor = candidate.locator("xpath=ancestor-or-self::button[1]")
-                if ancestor.count() > 0 and ancestor.first.is_visible():
+                if ancestor.first.is_visible():
                     return ancestor.first
                 ancestor = candidate.locator("xpath=ancestor-or-self::*[@role='button'][1]")
-                if ancestor.count() > 0 and ancestor.first.is_visible():
+                if ancestor.first.is_visible():
                     return ancestor.first
             except Exception:
                 pass
@@ -473,15 +732,80 @@ def find_date_posted_button(page):
 
     # Fallback: visible button with label
     btn = page.get_by_role("button", name=name_regex)
-    if btn.count() > 0 and btn.first.is_visible():
+    if btn.first.is_visible():
         return btn.first
     btn = page.locator("[role='button']").filter(has_text=name_regex)
-    if btn.count() > 0 and btn.first.is_visible():
+    if btn.first.is_visible():
         return btn.first
     return None
 
 
+def with_query_params(url: str, params: dict) -> str:
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query, keep_blank_values=True))
+    for key, value in params.items():
+        if value is None:
+            query.pop(key, None)
+        else:
+            query[key] = value
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+_JOBS_SEARCH_URL = "https://www.linkedin.com/jobs/search/"
+
+
+def search_url_params(filters: dict) -> dict:
+    params = {}
+    if filters.get("location"):
+        # A stale geoId would win over the location text, so drop it
+        params["location"] = filters["location"]
+        params["geoId"] = None
+    if "distance" in filters:
+        # 0 or empty means "Any distance", as in the filter controls path,
+        # which LinkedIn shows when there is no distance param
+        params["distance"] = str(filters["distance"]) if filters.get("distance") else None
+    if filters.get("time_posted"):
+        value = _DATE_POSTED_VALUES.get(filters["time_posted"].strip().lower())
+        if value is None:
+            raise ValueError(f"no search URL value for time_posted '{filters['time_posted']}'")
+        # "Any time" has no f_TPR value; drop the param instead
+        params["f_TPR"] = value or None
+    if filters.get("easy_apply"):
+        params["f_AL"] = "true"
+    return params
+
+
+def build_jobs_url(current_url: str, filters: dict) -> str:
+    # Keep the user's own search (keywords etc.) when already on a results page
+    base = current_url if "/jobs/search" in current_url else _JOBS_SEARCH_URL
+    return with_query_params(base, search_url_params(filters))
+
+
+# LinkedIn's empty-search states; a filter set with no matches is still applied
+_NO_RESULTS_SELECTORS = [
+    "div.jobs-search-no-results-banner",
+    "[class*='jobs-search-no-results']",
+    "[class*='no-results-banner']",
+]
+
+
 def apply_filters(page, filters: dict) -> None:
+    # One navigation to the filtered search URL replaces dozens of UI clicks;
+    # the filter controls are only driven when that fails.
+    if filters.get("use_search_url", True):
+        try:
+            page.goto(build_jobs_url(page.url, filters), wait_until="domcontentloaded")
+            page.wait_for_selector(
+                ", ".join([_JOB_CARDS_SELECTOR] + _NO_RESULTS_SELECTORS), timeout=10000
+            )
+            print("filters: applied via search URL")
+            return
+        except Exception as e:
+            print(f"filters: search URL failed ({e}), using the filter controls")
+    apply_filters_via_controls(page, filters)
+
+
+def apply_filters_via_controls(page, filters: dict) -> None:
     failures = []
     use_all_filters = filters.get("use_all_filters", True)
     wait_after_each = filters.get("wait_after_each_seconds", 0)
@@ -510,7 +834,6 @@ def apply_filters(page, filters: dict) -> None:
             failures.append(f"time_posted ({e})")
     if filters.get("easy_apply"):
         try:
-            ok = apply_easy_apply_filter(page, use_all_filters)
             ok = apply_easy_apply_filter(page, use_all_filters)
             print(f"easy_apply: {'applied' if ok else 'not applied'}")
             wait_for_results_refresh(page, wait_after_each)
@@ -526,220 +849,481 @@ def apply_filters(page, filters: dict) -> None:
         input("Press Enter to continue...")
 
 
-def get_job_cards(page):
-    selectors = [
-        "ul.jobs-search-results__list li",
-        "div.jobs-search-results-list ul li",
-        "div.jobs-search-results-list__content ul li",
-        "ul.scaffold-layout__list-container li",
-        "div.scaffold-layout__list-detail-inner ul li",
-        "li[data-occludable-job-id]",
-        "li[data-job-id]",
-        "div.job-card-container",
-        "div[data-occludable-job-id]",
-        "div[data-job-id]",
-    ]
-    for sel in selectors:
-        loc = page.locator(sel)
-        if loc.count() > 0:
-            return loc
-    return page.locator("ul.jobs-search-results__list li")  # default empty locator
-
-
-def get_results_container(page):
-    selectors = [
-        "div.jobs-search-results-list",
-        "div.jobs-search-results-list__content",
-        "ul.jobs-search-results__list",
-        "div.scaffold-layout__list-detail",
-        "div.scaffold-layout__list-detail-inner",
-    ]
-    for sel in selectors:
-        loc = page.locator(sel)
-        if loc.count() > 0 and loc.first.is_visible():
-            return loc.first
-    return None
+_JOB_CARD_SELECTORS = [
+    "ul.jobs-search-results__list li",
+    "div.jobs-search-results-list ul li",
+    "div.jobs-search-results-list__content ul li",
+    "ul.scaffold-layout__list-container li",
+    "div.scaffold-layout__list-detail-inner ul li",
+    "li[data-occludable-job-id]",
+    "li[data-job-id]",
+    "div.job-card-container",
+    "div[data-occludable-job-id]",
+    "div[data-job-id]",
+]
+_JOB_CARDS_SELECTOR = ", ".join(_JOB_CARD_SELECTORS)
+
+# Reads the job id of every card not returned by a previous call, in one
+# round-trip. A cursor on window remembers how far the current list was
+# enumerated, so each scroll only ships the newly appended cards; it restarts
+# when the list is replaced (new search, reload) or shrinks. The
+# /jobs/view/<id> fallback runs in the browser so only the id crosses CDP.
+# Card text is only shipped when it mentions "applied" ("" otherwise), and
+# easy_apply says whether the card shows the Easy Apply badge. Both are null
+# for occluded cards that have no content rendered yet.
+_EXTRACT_NEW_JOB_IDS_JS = r"""
+(selectors) => {
+  const idOf = (el) => {
+    const id = el.getAttribute("data-occludable-job-id") || el.getAttribute("data-job-id");
+    if (id) return id;
+    const link = el.querySelector("a[href*='/jobs/view/']") || el.querySelector("a");
+    const href = link ? link.getAttribute("href") : null;
+    const match = href ? href.match(/\/jobs\/view\/(\d+)/) : null;
+    return match ? match[1] : null;
+  };
+  const summaryOf = (index, el) => {
+    const text = (el.textContent || "").replace(/\s+/g, " ").trim();
+    return {
+      index,
+      id: idOf(el),
+      applied_text: text ? (/applied/i.test(text) ? text : "") : null,
+      easy_apply: text ? /easy apply|kolay/i.test(text) : null,
+    };
+  };
+  for (const sel of selectors) {
+    const els = document.querySelectorAll(sel);
+    if (els.length === 0) continue;
+    const cursor = window.__jobCardsCursor;
+    const start =
+      cursor && cursor.selector === sel && cursor.first === els[0] && cursor.count <= els.length
+        ? cursor.count
+        : 0;
+    window.__jobCardsCursor = { selector: sel, first: els[0], count: els.length };
+    const cards = [];
+    for (let i = start; i < els.length; i++) cards.push(summaryOf(i, els[i]));
+    return { selector: sel, total: els.length, cards };
+  }
+  return { selector: null, total: 0, cards: [] };
+}
+"""
+
+
+def extract_new_job_ids(page) -> dict:
+    return page.evaluate(_EXTRACT_NEW_JOB_IDS_JS, _JOB_CARD_SELECTORS)
+
+
+_REWIND_JOB_CARDS_JS = r"""
+(index) => {
+  const cursor = window.__jobCardsCursor;
+  if (cursor && cursor.count > index) cursor.count = index;
+}
+"""
+
+
+def rewind_job_cards(page, index: int) -> None:
+    # Hand the card at index (and the ones after it) out again on the next
+    # call, so a card whose click failed is retried; handled ones hit `seen`
+    try:
+        page.evaluate(_REWIND_JOB_CARDS_JS, index)
+    except Exception:
+        pass
 
 
-def is_recently_applied_card(card) -> bool:
+_JOB_CARD_METADATA_JS = r"""
+(els) => {
+  const textOf = (el, sels) => {
+    for (const sel of sels) {
+      const node = el.querySelector(sel);
+      const text = node ? (node.textContent || "").replace(/\s+/g, " ").trim() : "";
+      if (text) return text;
+    }
+    return null;
+  };
+  return els.map((el) => {
+    const link = el.querySelector("a[href*='/jobs/view/']") || el.querySelector("a");
+    const href = link ? link.href : null;
+    const match = href ? href.match(/\/jobs\/view\/(\d+)/) : null;
+    return {
+      id: el.getAttribute("data-occludable-job-id") || el.getAttribute("data-job-id") || (match ? match[1] : null),
+      title: textOf(el, [".job-card-list__title", ".job-card-list__title--link", ".artdeco-entity-lockup__title"]),
+      company: textOf(el, [".job-card-container__company-name", ".job-card-container__primary-description", ".artdeco-entity-lockup__subtitle"]),
+      href,
+    };
+  });
+}
+"""
+
+
+def read_job_card_metadata(page) -> list:
+    # One pass over the rendered cards, no clicks; occluded cards come back
+    # without a title and are picked up once scrolling renders them.
+    for sel in _JOB_CARD_SELECTORS:
+        cards = page.locator(sel).evaluate_all(_JOB_CARD_METADATA_JS)
+        if cards:
+            return cards
+    return []
+
+
+_RESULTS_CONTAINER_SELECTORS = [
+    "div.jobs-search-results-list",
+    "div.jobs-search-results-list__content",
+    "ul.jobs-search-results__list",
+    "div.scaffold-layout__list-detail",
+    "div.scaffold-layout__list-detail-inner",
+]
+
+# Scrolls the first visible results container (in priority order) by most of
+# its height, or the window when none is found, then waits in the page until
+# new cards are appended or the timeout passes. One evaluate replaces the
+# container lookup, the scroll and a fixed sleep; returns the new card count.
+_SCROLL_RESULTS_JS = r"""
+async ([selectors, cardSelector, timeoutMs]) => {
+  const visible = (el) => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+  let container = null;
+  for (const sel of selectors) {
+    container = Array.from(document.querySelectorAll(sel)).find(visible) || null;
+    if (container) break;
+  }
+  const before = document.querySelectorAll(cardSelector).length;
+  const height = container ? container.clientHeight : window.innerHeight;
+  (container || window).scrollBy(0, Math.round(height * 0.8) || 1200);
+  return await new Promise((resolve) => {
+    let timer = null;
+    const observer = new MutationObserver(() => {
+      if (document.querySelectorAll(cardSelector).length > before) finish();
+    });
+    const finish = () => {
+      observer.disconnect();
+      clearTimeout(timer);
+      resolve(document.querySelectorAll(cardSelector).length - before);
+    };
+    observer.observe(container || document.body, { childList: true, subtree: true });
+    timer = setTimeout(finish, timeoutMs);
+  });
+}
+"""
+
+
+def scroll_results(page, timeout_ms: int = 1000) -> int:
     try:
-        text = card.text_content() or ""
+        return page.evaluate(
+            _SCROLL_RESULTS_JS, [_RESULTS_CONTAINER_SELECTORS, _JOB_CARDS_SELECTOR, timeout_ms]
+        )
     except Exception:
-        return False
-    t = " ".join(text.split()).lower()
+        # e.g. the page navigated mid-scroll; keep the old pacing
+        time.sleep(timeout_ms / 1000)
+        return 0
+
+
+def is_recently_applied_card(card, text=None) -> bool:
+    if text is None:
+        try:
+            text = card.text_content() or ""
+        except Exception:
+            return False
+    t = _RX_WHITESPACE.sub(" ", text).lower()
     # Match: "Applied 5 minutes ago", "Applied 2 hours ago", "Applied a few minutes ago"
-    if re.search(r"\bapplied\b.*\bago\b", t):
-        if re.search(r"\b(\d+|a|an|few)\b.*\b(minute|minutes|hour|hours)\b", t):
-            return True
-        if re.search(r"\b\d+\s*(m|h)\b", t):
-            return True
-    return False
+    return _RX_RECENTLY_APPLIED.match(t) is not None
+
+
+_FIRST_RESULT_TEXT_JS = r"""
+() => {
+  const li = document.querySelector("ul.jobs-search-results__list li");
+  return li ? li.textContent : null;
+}
+"""
+_FIRST_RESULT_CHANGED_JS = r"""
+(before) => {
+  const li = document.querySelector("ul.jobs-search-results__list li");
+  const after = li ? li.textContent : null;
+  return !!after && after !== before;
+}
+"""
 
 
 def wait_for_results_refresh(page, min_wait_seconds: float) -> None:
     if min_wait_seconds:
         time.sleep(min_wait_seconds)
 
-    list_locator = page.locator("ul.jobs-search-results__list li")
-    before = None
     try:
-        if list_locator.count() > 0:
-            before = list_locator.nth(0).text_content()
+        before = page.evaluate(_FIRST_RESULT_TEXT_JS)
     except Exception:
         before = None
 
-    try:
-        page.wait_for_load_state("networkidle", timeout=5000)
-    except Exception:
-        pass
+    wait_for_network_idle(page, 5000)
 
     if before:
-        end_time = time.time() + 5
-        while time.time() < end_time:
-            try:
-                if list_locator.count() > 0:
-                    after = list_locator.nth(0).text_content()
-                    if after and after != before:
-                        break
-            except Exception:
-                pass
-            time.sleep(0.3)
+        # Checked in the page on every DOM mutation instead of polling over CDP
+        try:
+            page.wait_for_function(_FIRST_RESULT_CHANGED_JS, arg=before, polling="mutation", timeout=5000)
+        except Exception:
+            pass
 
 
-def extract_job_id(card):
-    job_id = card.get_attribute("data-occludable-job-id")
-    if job_id:
-        return job_id
-    job_id = card.get_attribute("data-job-id")
-    if job_id:
-        return job_id
-    try:
-        href = card.locator("a").first.get_attribute("href")
-        if href:
-            m = re.search(r"/jobs/view/(\d+)", href)
-            if m:
-                return m.group(1)
-    except Exception:
-        pass
-    return None
+# The details pane renders after the URL changes; wait until its title link or
+# apply button points at the clicked job instead of the previous one
+_JOB_DETAILS_READY_JS = r"""
+(jobId) => !!document.querySelector(
+  `h1 a[href*="/jobs/view/${jobId}"], h2 a[href*="/jobs/view/${jobId}"], ` +
+  `.jobs-apply-button[data-job-id="${jobId}"]`
+)
+"""
 
 
-def get_job_title(page):
-    selectors = [
-        ".jobs-unified-top-card__job-title",
-        "h1",
-        "h2",
-    ]
-    for sel in selectors:
-        loc = page.locator(sel)
-        if loc.count() > 0 and loc.first.is_visible():
-            text = loc.first.text_content()
-            if text:
-                return text.strip()
-    return None
+def wait_for_job_details(page, job_id: str) -> None:
+    if job_id.isdigit():
+        try:
+            page.wait_for_function(_JOB_DETAILS_READY_JS, arg=job_id, timeout=3000)
+            return
+        except Exception:
+            pass
+    wait_for_visible(page, ".jobs-unified-top-card__job-title, h1", 3000)
+
+
+_JOB_TITLE_SELECTORS = [
+    ".jobs-unified-top-card__job-title",
+    "h1",
+    "h2",
+]
+
+_JOB_COMPANY_SELECTORS = [
+    ".jobs-unified-top-card__company-name",
+    ".job-details-jobs-unified-top-card__company-name",
+    "a[data-control-name='company_link']",
+]
+
+# For each selector list, the text of the first visible, non-empty match in
+# list order. Title and company come back from the same evaluate.
+_FIRST_VISIBLE_TEXTS_JS = r"""
+(groups) => {
+  const visible = (el) => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+  return groups.map((selectors) => {
+    for (const sel of selectors) {
+      for (const el of document.querySelectorAll(sel)) {
+        if (!visible(el)) continue;
+        const text = (el.textContent || "").trim();
+        if (text) return text;
+      }
+    }
+    return null;
+  });
+}
+"""
+
+
+def get_job_details(page):
+    title, company = page.evaluate(
+        _FIRST_VISIBLE_TEXTS_JS, [_JOB_TITLE_SELECTORS, _JOB_COMPANY_SELECTORS]
+    )
+    return title, company
 
 
-def get_job_company(page):
-    selectors = [
-        ".jobs-unified-top-card__company-name",
-        ".job-details-jobs-unified-top-card__company-name",
-        "a[data-control-name='company_link']",
-    ]
-    for sel in selectors:
-        loc = page.locator(sel)
-        if loc.count() > 0 and loc.first.is_visible():
-            text = loc.first.text_content()
-            if text:
-                return text.strip()
-    return None
+_EASY_APPLY_CONTAINER_SELECTORS = [
+    "div.jobs-details__main-content",
+    "div.jobs-details__container",
+    "div.jobs-search__job-details",
+    "div.jobs-search__job-details--wrapper",
+    "section.jobs-details-top-card",
+    "div.jobs-unified-top-card",
+    "main#main",
+]
+
+
+# Detail-pane container the button was last found in, per page. The pane
+# layout is the same for every job, so later jobs check it first.
+_easy_apply_containers = weakref.WeakKeyDictionary()
+
+
+def easy_apply_button_in(page, container_selector):
+    btn = page.locator(container_selector).locator("button").filter(has_text=_RX_EASY_APPLY)
+    if btn.count() == 0:
+        return None
+    primary = btn.filter(has=page.locator(".artdeco-button--primary"))
+    if primary.count() > 0:
+        return primary.first
+    # prefer buttons that look like apply action
+    apply_btn = btn.filter(has=page.locator("span")).filter(
+        has_text=_RX_EASY_APPLY
+    )
+    if apply_btn.count() > 0:
+        return apply_btn.first
+    return btn.first
 
 
 def easy_apply_button(page):
-    label_re = re.compile("Easy Apply|Kolay", re.I)
-    containers = [
-        "div.jobs-details__main-content",
-        "div.jobs-details__container",
-        "div.jobs-search__job-details",
-        "div.jobs-search__job-details--wrapper",
-        "section.jobs-details-top-card",
-        "div.jobs-unified-top-card",
-        "main#main",
-    ]
-    for sel in containers:
-        container = page.locator(sel)
-        if container.count() == 0:
+    cached = _easy_apply_containers.get(page)
+    if cached:
+        btn = easy_apply_button_in(page, cached)
+        if btn:
+            return btn
+    for sel in present_selectors(page, _EASY_APPLY_CONTAINER_SELECTORS):
+        if sel == cached:
             continue
-        btn = container.locator("button").filter(has_text=label_re)
-        if btn.count() > 0:
-            primary = btn.filter(has=page.locator(".artdeco-button--primary"))
-            if primary.count() > 0:
-                return primary.first
-            # prefer buttons that look like apply action
-            apply_btn = btn.filter(has=page.locator("span")).filter(
-                has_text=label_re
-            )
-            if apply_btn.count() > 0:
-                return apply_btn.first
-            return btn.first
+        btn = easy_apply_button_in(page, sel)
+        if btn:
+            _easy_apply_containers[page] = sel
+            return btn
 
     # Fallback: specific class used for apply buttons
-    btn = page.locator("button.jobs-apply-button").filter(has_text=label_re)
+    btn = page.locator("button.jobs-apply-button").filter(has_text=_RX_EASY_APPLY)
     if btn.count() > 0:
         return btn.first
     return None
 
 
-def is_modal_open(page) -> bool:
-    return page.locator("div[role='dialog']").is_visible()
-
-
-def wait_for_modal_close(page, max_wait_seconds=None):
-    start = time.time()
-    while is_modal_open(page):
-        time.sleep(0.5)
-        if max_wait_seconds and (time.time() - start) > max_wait_seconds:
-            return False
-    return True
+# Snapshot of the Easy Apply modal: whether it is open, which action buttons
+# are visible and whether a validation error is shown. One evaluate replaces
+# the is_visible()/count() probe per button and per error message.
+_MODAL_STATE_JS = r"""
+() => {
+  const doneRe = new RegExp(""" + json.dumps(_RX_DONE.pattern) + r""", "i");
+  const visible = (el) =>
+    !!(el && (el.offsetWidth || el.offsetHeight || el.getClientRects().length));
+  const dialog = document.querySelector("div[role='dialog']");
+  if (!visible(dialog)) return { open: false };
+  const texts = Array.from(dialog.querySelectorAll("button"))
+    .filter(visible)
+    .map((b) => (b.textContent || "").toLowerCase());
+  const has = (action) => texts.some((t) => t.includes(action));
+  const progress = dialog.querySelector("progress, [role='progressbar']");
+  return {
+    open: true,
+    step: progress ? progress.getAttribute("value") || progress.getAttribute("aria-valuenow") : null,
+    submit: has("submit"),
+    review: has("review"),
+    next: has("next"),
+    done: texts.some((t) => doneRe.test(t)),
+    error: Array.from(dialog.querySelectorAll(".artdeco-inline-feedback__message")).some(visible),
+  };
+}
+"""
+
+# Resolves once the modal closes or shows a button the loop acts on. Polled
+# with a MutationObserver in the browser, so it wakes on DOM changes instead
+# of re-querying over CDP on a fixed interval.
+_MODAL_READY_JS = (
+    "() => { const s = ("
+    + _MODAL_STATE_JS
+    + ")(); return !s.open || s.submit || s.review || s.next || s.done ? s : null; }"
+)
+
+# Resolves once the progress bar moved off the given value, an error shows or
+# the modal closed
+_MODAL_STEP_SETTLED_JS = (
+    "(before) => { const s = ("
+    + _MODAL_STATE_JS
+    + ")(); return !s.open || s.error || s.step !== before ? s : null; }"
+)
+
+_MODAL_ACTION_WAIT_MS = 2000
+# Clicks that drive the application get more time than the 1s page default
+# used for probes, since LinkedIn can be slow to make them actionable
+_ACTION_TIMEOUT_MS = 5000
+
+
+def wait_for_step_change(page, step_before, timeout_ms=_MODAL_ACTION_WAIT_MS):
+    try:
+        handle = page.wait_for_function(
+            _MODAL_STEP_SETTLED_JS, arg=step_before, polling="mutation", timeout=timeout_ms
+        )
+    except Exception:
+        return None
+    return handle.json_value()
 
 
-def click_done_if_present(page, timeout_ms=8000) -> bool:
-    done_btn = page.locator("button:has-text('Done')")
+def wait_for_validation_error(modal, timeout_ms=500) -> bool:
+    # Resolves as soon as an inline error renders instead of sleeping a fixed time
     try:
-        if done_btn.count() == 0:
-            done_btn = page.get_by_role("button", name=re.compile("Done|Bitti|Tamam", re.I))
-        done_btn.first.wait_for(state="visible", timeout=timeout_ms)
-        done_btn.first.click()
+        modal.locator(".artdeco-inline-feedback__message").first.wait_for(state="visible", timeout=timeout_ms)
         return True
     except Exception:
         return False
 
 
+def wait_for_modal_state(page, timeout_ms=_MODAL_ACTION_WAIT_MS):
+    try:
+        handle = page.wait_for_function(_MODAL_READY_JS, polling="mutation", timeout=timeout_ms)
+    except Exception:
+        return None
+    return handle.json_value()
+
+
+# Post-submit sequence in one evaluate: while the modal is open, click its
+# Done button whenever one shows up (the "Application sent" screen), polling
+# in the page; once it closes, click a leftover Done in a dialog. Resolves true
+# when the modal is gone, false after timeoutMs (0 waits without limit).
+_FINISH_AFTER_SUBMIT_JS = r"""
+async ([donePattern, timeoutMs]) => {
+  const done = new RegExp(donePattern, "i");
+  const visible = (el) =>
+    !!(el && (el.offsetWidth || el.offsetHeight || el.getClientRects().length));
+  const clickDone = (root) => {
+    const btn = Array.from(root.querySelectorAll("button")).find(
+      (b) => visible(b) && done.test(b.textContent || "")
+    );
+    if (btn) btn.click();
+  };
+  const deadline = Date.now() + timeoutMs;
+  for (;;) {
+    const dialog = document.querySelector("div[role='dialog']");
+    if (!visible(dialog)) break;
+    if (timeoutMs && Date.now() > deadline) return false;
+    clickDone(dialog);
+    await new Promise((resolve) => setTimeout(resolve, 200));
+  }
+  for (const root of document.querySelectorAll("[role='dialog'], [role='alertdialog'], .artdeco-modal")) {
+    clickDone(root);
+  }
+  return true;
+}
+"""
+
+
+def finish_after_submit(page, max_wait_seconds=None) -> bool:
+    timeout_ms = max_wait_seconds * 1000 if max_wait_seconds else 0
+    try:
+        return page.evaluate(_FINISH_AFTER_SUBMIT_JS, [_RX_DONE.pattern, timeout_ms])
+    except Exception:
+        # The page navigated while waiting; finished if no modal is left
+        try:
+            return not page.locator("div[role='dialog']").first.is_visible()
+        except Exception:
+            return False
+
+
+_SALARY_KEYWORDS = [
+    "salary",
+    "compensation",
+    "pay",
+    "expected salary",
+    "desired salary",
+    "salary expectation",
+    "annual",
+    "monthly",
+    "hourly",
+    "rate",
+    "wage",
+    "maaş",
+    "maas",
+    "ücret",
+    "ucret",
+    "maaş beklentisi",
+    "ucret beklentisi",
+]
+_SALARY_KW_RE = re.compile("|".join(re.escape(k) for k in _SALARY_KEYWORDS), re.I)
+
+
+# aria-label/value of every field and text/for of every label in one call
+# each, so only the matching fields cost a round-trip.
+_INPUT_FIELDS_JS = "(els) => els.map((el) => ({ aria: el.getAttribute('aria-label') || '', value: el.value || '' }))"
+_LABEL_FIELDS_JS = "(els) => els.map((el) => ({ text: (el.textContent || '').trim(), target: el.getAttribute('for') }))"
+
+
 def auto_fill_defaults_in_modal(modal, defaults: dict) -> None:
     salary = defaults.get("salary")
     if not salary:
         return
 
-    keywords = [
-        "salary",
-        "compensation",
-        "pay",
-        "expected salary",
-        "desired salary",
-        "salary expectation",
-        "annual",
-        "monthly",
-        "hourly",
-        "rate",
-        "wage",
-        "maaş",
-        "maas",
-        "ücret",
-        "ucret",
-        "maaş beklentisi",
-        "ucret beklentisi",
-    ]
-    kw_re = re.compile("|".join(re.escape(k) for k in keywords), re.I)
-
     def fill_input(input_locator):
         try:
             current = input_locator.input_value()
@@ -752,30 +1336,26 @@ def auto_fill_defaults_in_modal(modal, defaults: dict) -> None:
 
     # 1) Inputs with aria-label
     inputs = modal.locator("input[type='text'], input[type='number'], textarea")
-    for i in range(inputs.count()):
-        inp = inputs.nth(i)
-        try:
-            aria = inp.get_attribute("aria-label") or ""
-        except Exception:
-            aria = ""
-        if aria and kw_re.search(aria):
-            if fill_input(inp):
-                print(f"salary: filled via aria-label '{aria}'")
+    try:
+        fields = inputs.evaluate_all(_INPUT_FIELDS_JS)
+    except Exception:
+        fields = []
+    for i, field in enumerate(fields):
+        aria = field["aria"]
+        if aria and _SALARY_KW_RE.search(aria) and not field["value"].strip():
+            inputs.nth(i).fill(str(salary))
+            print(f"salary: filled via aria-label '{aria}'")
 
     # 2) Label -> input via for=
-    labels = modal.locator("label")
-    for i in range(labels.count()):
-        lbl = labels.nth(i)
-        try:
-            text = (lbl.text_content() or "").strip()
-        except Exception:
-            text = ""
-        if not text or not kw_re.search(text):
+    try:
+        label_fields = modal.locator("label").evaluate_all(_LABEL_FIELDS_JS)
+    except Exception:
+        label_fields = []
+    for field in label_fields:
+        text = field["text"]
+        if not text or not _SALARY_KW_RE.search(text):
             continue
-        try:
-            target_id = lbl.get_attribute("for")
-        except Exception:
-            target_id = None
+        target_id = field["target"]
         if target_id:
             inp = modal.locator(f"#{target_id}")
             if inp.count() > 0:
@@ -783,145 +1363,87 @@ def auto_fill_defaults_in_modal(modal, defaults: dict) -> None:
                     print(f"salary: filled via label '{text}'")
 
 
-def ensure_follow_company_unchecked(modal) -> None:
-    # Direct selector from observed DOM
-    cb = modal.locator("#follow-company-checkbox")
-    if cb.count() == 0:
-        cb = modal.page.locator("#follow-company-checkbox")
-    if cb.count() > 0:
-        try:
-            state = cb.first.evaluate(
-                "el => ({checked: el.checked, attr: el.getAttribute('checked')})"
-            )
-        except Exception:
-            state = {"checked": None, "attr": None}
-        if state.get("checked") is True:
-            try:
-                result = cb.first.evaluate(
-                    "el => { el.checked = false; "
-                    "el.dispatchEvent(new Event('input', {bubbles:true})); "
-                    "el.dispatchEvent(new Event('change', {bubbles:true})); "
-                    "return el.checked; }"
-                )
-                print(f"follow_company: set checked false -> {result}")
-            except Exception:
-                pass
-        # If still checked, click label to toggle
-        try:
-            if cb.first.is_checked():
-                lbl = modal.locator("label[for='follow-company-checkbox']")
-                if lbl.count() == 0:
-                    lbl = modal.page.locator("label[for='follow-company-checkbox']")
-                if lbl.count() > 0:
-                    lbl.first.click(force=True)
-                    time.sleep(0.1)
-            if cb.first.is_checked():
-                # Last resort: click the input directly
-                cb.first.click(force=True)
-                time.sleep(0.1)
-        except Exception:
-            pass
-        try:
-            final_checked = cb.first.is_checked()
-        except Exception:
-            final_checked = None
-        print(f"follow_company: final checked={final_checked}")
-        if final_checked is False:
-            return
+_FOLLOW_KEYWORDS = [
+    "follow",
+    "company",
+    "employer",
+    "follow the company",
+    "follow company",
+    "stay up to date",
+    "işvereni takip",
+    "şirketi takip",
+    "sirketi takip",
+    "takip et",
+]
+_FOLLOW_KW_RE = re.compile("|".join(re.escape(k) for k in _FOLLOW_KEYWORDS), re.I)
+
+
+# Same search order as the observed LinkedIn variants: the fixed id, a
+# checkbox named "follow", an input whose aria-label has a keyword, then a
+# label with a keyword and its for= target or nested checkbox. Runs in one
+# evaluate and returns how the box was handled, or null if none was found.
+_UNCHECK_FOLLOW_COMPANY_JS = r"""
+(root, [followPattern, kwPattern]) => {
+  const follow = new RegExp(followPattern, "i");
+  const kw = new RegExp(kwPattern, "i");
+  const isChecked = (el) => el.checked === true || el.getAttribute("aria-checked") === "true";
+  const uncheck = (el, via) => {
+    if (!isChecked(el)) return `already unchecked (${via})`;
+    el.click();
+    return `unchecked via ${via} -> checked=${isChecked(el)}`;
+  };
+
+  const direct = root.querySelector("#follow-company-checkbox") || document.getElementById("follow-company-checkbox");
+  if (direct) {
+    if (isChecked(direct)) {
+      direct.click();
+      const label = document.querySelector("label[for='follow-company-checkbox']");
+      if (isChecked(direct) && label) label.click();
+    }
+    if (!isChecked(direct)) return "final checked=false (id)";
+  }
+
+  for (const el of root.querySelectorAll("input[type='checkbox'], [role='checkbox']")) {
+    const labels = el.labels ? Array.from(el.labels).map((l) => l.textContent || "").join(" ") : "";
+    const name = el.getAttribute("aria-label") || labels || el.textContent || "";
+    if (follow.test(name) && isChecked(el)) return uncheck(el, "role=checkbox");
+  }
+
+  for (const el of root.querySelectorAll("input[type='checkbox']")) {
+    if (kw.test(el.getAttribute("aria-label") || "")) return uncheck(el, "aria-label");
+  }
+
+  for (const label of root.querySelectorAll("label")) {
+    if (!kw.test((label.textContent || "").trim())) continue;
+    const targetId = label.getAttribute("for");
+    const target = targetId ? root.querySelector(`#${CSS.escape(targetId)}`) : null;
+    if (target) return uncheck(target, "label for=");
+    const nested = label.querySelector("input[type='checkbox'], [role='checkbox']");
+    if (nested) return uncheck(nested, "nested checkbox");
+  }
+  return null;
+}
+"""
 
-    keywords = [
-        "follow",
-        "company",
-        "employer",
-        "follow the company",
-        "follow company",
-        "stay up to date",
-        "işvereni takip",
-        "şirketi takip",
-        "sirketi takip",
-        "takip et",
-    ]
-    kw_re = re.compile("|".join(re.escape(k) for k in keywords), re.I)
 
-    # Prefer role-based checkbox (often used in LinkedIn modals)
-    role_cb = modal.get_by_role("checkbox", name=re.compile("follow", re.I))
-    if role_cb.count() > 0:
-        cb = role_cb.first
-        try:
-            aria_checked = cb.get_attribute("aria-checked")
-        except Exception:
-            aria_checked = None
-        try:
-            checked = cb.is_checked()
-        except Exception:
-            checked = None
-        if aria_checked == "true" or checked is True:
-            cb.click(force=True)
-            print("follow_company: unchecked via role=checkbox")
-            return
+def ensure_follow_company_unchecked(modal) -> None:
+    result = modal.first.evaluate(
+        _UNCHECK_FOLLOW_COMPANY_JS, [_RX_FOLLOW.pattern, _FOLLOW_KW_RE.pattern]
+    )
+    if result:
+        print(f"follow_company: {result}")
 
-    # Explicit input checkbox with aria-label
-    checkboxes = modal.locator("input[type='checkbox']")
-    for i in range(checkboxes.count()):
-        cb = checkboxes.nth(i)
-        try:
-            aria = cb.get_attribute("aria-label") or ""
-        except Exception:
-            aria = ""
-        if aria and kw_re.search(aria):
-            try:
-                checked = cb.is_checked()
-            except Exception:
-                checked = None
-            if checked is True:
-                cb.uncheck(force=True)
-                print("follow_company: unchecked via aria-label")
-            return
 
-    # Look for labels containing keywords
-    labels = modal.locator("label")
-    for i in range(labels.count()):
-        lbl = labels.nth(i)
-        try:
-            text = (lbl.text_content() or "").strip()
-        except Exception:
-            text = ""
-        if not text or not kw_re.search(text):
-            continue
-        # Try direct for= link
-        target_id = lbl.get_attribute("for")
-        if target_id:
-            cb = modal.locator(f"#{target_id}")
-            if cb.count() > 0:
-                try:
-                    checked = cb.first.is_checked()
-                except Exception:
-                    checked = None
-                if checked is True:
-                    cb.first.uncheck(force=True)
-                    print("follow_company: unchecked via label for=")
-                return
-        # Fallback: nested checkbox or role checkbox
-        cb = lbl.locator("input[type='checkbox']")
-        if cb.count() > 0:
-            try:
-                checked = cb.first.is_checked()
-            except Exception:
-                checked = None
-            if checked is True:
-                lbl.click(force=True)
-                print("follow_company: unchecked via nested checkbox")
-            return
-        role_cb = lbl.get_by_role("checkbox")
-        if role_cb.count() > 0:
-            try:
-                aria_checked = role_cb.first.get_attribute("aria-checked")
-            except Exception:
-                aria_checked = None
-            if aria_checked == "true":
-                role_cb.first.click(force=True)
-                print("follow_company: unchecked via label role=checkbox")
-            return
+def click_modal_button(button) -> bool:
+    # A failed click falls through to the manual-step prompt instead of
+    # stopping the bot
+    try:
+        button.first.click(timeout=_ACTION_TIMEOUT_MS)
+        return True
+    except Exception as e:
+        print(f"Could not click the modal button ({e})")
+        return False
+
 
 def complete_easy_apply(page, behavior: dict, defaults: dict) -> str:
     # Modal should already be open
@@ -929,11 +1451,21 @@ def complete_easy_apply(page, behavior: dict, defaults: dict) -> str:
     max_idle = behavior.get("max_idle_seconds", 900)
     auto_submit = behavior.get("auto_submit", False)
 
+    # Locators are lazy and re-resolve on every use, so build them once.
+    # Visible buttons matched on their text, exactly like _MODAL_STATE_JS
+    # decides which action is available, so .first is the button it saw.
+    modal = page.locator("div[role='dialog']")
+    modal_buttons = modal.locator("button:visible")
+    submit_btn = modal_buttons.filter(has_text=_RX_SUBMIT)
+    review_btn = modal_buttons.filter(has_text=_RX_REVIEW)
+    next_btn = modal_buttons.filter(has_text=_RX_NEXT)
+
     last_action = time.time()
 
     while True:
-        modal = page.locator("div[role='dialog']")
-        if not modal.is_visible():
+        # None means no action button showed up before the wait timed out
+        modal_state = wait_for_modal_state(page) or {"open": True}
+        if not modal_state["open"]:
             return "closed"
 
         try:
@@ -946,61 +1478,59 @@ def complete_easy_apply(page, behavior: dict, defaults: dict) -> str:
         except Exception:
             pass
 
-        submit_btn = modal.locator("button:has-text('Submit')")
-        if submit_btn.count() > 0 and submit_btn.first.is_visible():
+        if modal_state.get("submit"):
             if auto_submit:
                 print("Auto-submitting application...")
+                # Deliberate pause: a last chance to abort before the irreversible submit
                 time.sleep(2)
-                submit_btn.first.click()
-                time.sleep(0.5)
-                # Check for validation errors after submit
-                error = modal.locator(".artdeco-inline-feedback__message")
-                if error.count() > 0 and error.first.is_visible():
-                    if pause_on_unfilled:
-                        print("Validation error after submit. Fill required fields in the modal.")
-                        input("Press Enter to continue...")
-                    continue
-                # Click Done if the post-submit screen appears
-                click_done_if_present(page)
-                if not wait_for_modal_close(page, max_idle):
-                    print("Timed out waiting after submit. Leaving modal open.")
-                    return "timeout"
-                done_btn = page.locator("button:has-text('Done')")
-                if done_btn.count() > 0 and done_btn.first.is_visible():
-                    done_btn.first.click()
-                return "submitted"
+                if click_modal_button(submit_btn):
+                    # Check for validation errors after submit
+                    if wait_for_validation_error(modal):
+                        if pause_on_unfilled:
+                            print("Validation error after submit. Fill required fields in the modal.")
+                            input("Press Enter to continue...")
+                        continue
+                    # Click Done if the post-submit screen appears
+                    if not finish_after_submit(page, max_idle):
+                        print("Timed out waiting after submit. Leaving modal open.")
+                        return "timeout"
+                    return "submitted"
             else:
                 print("Ready to submit. Please review and click Submit in the modal.")
                 # After user submits, click Done if it appears
-                click_done_if_present(page)
-                if not wait_for_modal_close(page, max_idle):
+                if not finish_after_submit(page, max_idle):
                     print("Timed out waiting for submit. Leaving modal open.")
                     return "timeout"
-                # Sometimes a Done button appears after submit
-                done_btn = page.locator("button:has-text('Done')")
-                if done_btn.count() > 0 and done_btn.first.is_visible():
-                    done_btn.first.click()
                 return "submitted"
 
-        review_btn = modal.locator("button:has-text('Review')")
-        if review_btn.count() > 0 and review_btn.first.is_visible():
-            review_btn.first.click()
+        if modal_state.get("review") and click_modal_button(review_btn):
             last_action = time.time()
             continue
 
-        next_btn = modal.locator("button:has-text('Next')")
-        if next_btn.count() > 0 and next_btn.first.is_visible():
-            next_btn.first.click()
+        if modal_state.get("next") and click_modal_button(next_btn):
             last_action = time.time()
-            time.sleep(0.5)
-            # Detect validation errors
-            error = modal.locator(".artdeco-inline-feedback__message")
-            if error.count() > 0 and error.first.is_visible():
+            step_before = modal_state.get("step")
+            # Detect validation errors. With a progress bar, an advanced step
+            # means the page was accepted, so the error probe is only needed
+            # when the step stayed put.
+            if step_before is not None:
+                settled = wait_for_step_change(page, step_before)
+                has_error = bool(settled and settled.get("error"))
+            else:
+                has_error = wait_for_validation_error(modal)
+            if has_error:
                 if pause_on_unfilled:
                     print("Validation error. Fill required fields in the modal.")
                     input("Press Enter to continue...")
             continue
 
+        if modal_state.get("done"):
+            # Post-submit screen: the application already went through
+            if not finish_after_submit(page, max_idle):
+                print("Timed out waiting for the modal to close. Leaving modal open.")
+                return "timeout"
+            return "submitted"
+
         # If none of the expected buttons are visible, ask user to complete manually
         if pause_on_unfilled:
             print("Please complete this step manually in the modal.")
@@ -1008,127 +1538,246 @@ def complete_easy_apply(page, behavior: dict, defaults: dict) -> str:
             last_action = time.time()
             continue
 
-        # Safety fallback to avoid tight loop
+        # No sleep needed: wait_for_modal_state already blocked until its timeout
         if time.time() - last_action > max_idle:
             return "timeout"
-        time.sleep(0.5)
 
 
 def main():
+    # Imported here so the helpers can be imported without Playwright's startup cost
+    from playwright.sync_api import sync_playwright
+
     config = load_config(CONFIG_PATH)
     behavior = config.get("behavior", {})
     defaults = config.get("defaults", {})
-    state_path = config.get("state", {}).get("file", "state/applied.json")
-    state = load_state(state_path)
+    filters = config.get("filters") or {}
+    state_path = config.get("state", {}).get("file", "state/applied.db")
+    conn = open_state_db(state_path)
+    max_records = int(config.get("state", {}).get("max_records", 10_000))
+    archive_path = config.get("state", {}).get("archive_file", "state/archive.jsonl")
+    archived = prune_job_records(conn, max_records, archive_path)
+    if archived:
+        print(f"Archived {archived} oldest jobs to {archive_path}")
+    storage_path = config.get("state", {}).get("storage_file", "state/storage.json")
     refresh_after_submitted = behavior.get("refresh_after_submitted", None)
+    metadata_only = behavior.get("metadata_only", False)
+    skip_cards_without_easy_apply = behavior.get("skip_cards_without_easy_apply", False)
     submitted_since_refresh = 0
 
+    browser_config = config.get("browser", {})
+    cdp_url = browser_config.get("cdp_url", "http://localhost:9222")
+    profile_dir = browser_config.get("persistent_profile")
+
+    # Reuse an already running debug Chrome; only start one when none answers
+    if not profile_dir and not cdp_endpoint_ready(cdp_url) and browser_config.get("chrome_path"):
+        print(f"No Chrome on {cdp_url}, starting {browser_config['chrome_path']} ...")
+        if not launch_debug_chrome(browser_config, cdp_url):
+            print("Chrome did not open its debugging port in time.")
+
     with sync_playwright() as p:
-        print("Connecting to Chrome on http://localhost:9222 ...")
-        browser = p.chromium.connect_over_cdp("http://localhost:9222")
+        cookies_restored = False
+        if profile_dir:
+            # The profile directory keeps the login between runs, so there
+            # is no cookie file to restore and no debug Chrome to attach to.
+            print(f"Starting Chrome with profile {profile_dir} ...")
+            context = p.chromium.launch_persistent_context(
+                profile_dir,
+                headless=False,
+                executable_path=browser_config.get("chrome_path"),
+            )
+            contexts = [context]
+            if not find_jobs_page(contexts):
+                start_page = context.pages[0] if context.pages else context.new_page()
+                start_page.goto("https://www.linkedin.com/jobs/")
+        else:
+            print(f"Connecting to Chrome on {cdp_url} ...")
+            browser = p.chromium.connect_over_cdp(cdp_url)
+            contexts = browser.contexts
+            # CDP shares the browser's default context, so cookies saved on the
+            # last exit log this session back in without a manual sign-in.
+            # Skipped when the browser is still signed in.
+            if browser.contexts:
+                try:
+                    if restore_storage_state(browser.contexts[0], storage_path):
+                        cookies_restored = True
+                        print(f"Restored session cookies from {storage_path}")
+                except Exception as e:
+                    print(f"Could not restore session cookies ({e})")
 
-        page = find_jobs_page(browser)
+        page = find_jobs_page(contexts)
         while not page:
             prompt_retry("No LinkedIn Jobs tab found. Open https://www.linkedin.com/jobs/ in the debug Chrome.")
-            page = find_jobs_page(browser)
+            page = find_jobs_page(contexts)
 
         page.bring_to_front()
-        page.set_default_timeout(5000)
+        # Navigations (reload, goto) keep a realistic page-load budget
+        page.set_default_navigation_timeout(30000)
 
-        print("Starting job loop. Press Ctrl+C in the terminal to stop.")
-        seen = set(state.get("jobs", {}).keys())
-
-        while True:
+        # The tab loaded before the cookies were added; reload it so it comes
+        # back signed in instead of staying on the logged-out page
+        if cookies_restored:
             try:
-                list_locator = get_job_cards(page)
-                if list_locator.count() == 0:
-                    print("No job cards found. Make sure the Jobs search results list is visible.")
-                    time.sleep(3)
-                    continue
-
-                count = list_locator.count()
-                for i in range(count):
-                    card = list_locator.nth(i)
-                    job_id = extract_job_id(card) or f"idx-{i}-{int(time.time())}"
-                    if job_id in seen:
-                        continue
-                    if is_recently_applied_card(card):
-                        state["jobs"][job_id] = {
-                            "status": "skipped_recently_applied",
-                            "title": None,
-                            "company": None,
-                            "url": page.url,
-                            "updated_at": now_iso(),
-                        }
-                        save_state(state_path, state)
-                        seen.add(job_id)
-                        continue
+                page.reload(wait_until="domcontentloaded")
+            except Exception as e:
+                print(f"Could not reload the Jobs tab ({e})")
 
-                    try:
-                        card.scroll_into_view_if_needed()
-                        card.click()
-                    except Exception:
-                        continue
+        if filters:
+            apply_filters(page, filters)
 
-                    time.sleep(1)
-
-                    title = get_job_title(page)
-                    company = get_job_company(page)
-
-                    btn = easy_apply_button(page)
-                    if not btn:
-                        state["jobs"][job_id] = {
-                            "status": "skipped_no_easy_apply",
-                            "title": title,
-                            "company": company,
-                            "url": page.url,
-                            "updated_at": now_iso(),
-                        }
-                        save_state(state_path, state)
-                        seen.add(job_id)
+        # Job loop probes should fail fast; intentional waits and clicks pass
+        # their own timeout. Set after the filters, whose controls keep the
+        # default action timeout.
+        page.set_default_timeout(1000)
+
+        print("Starting job loop. Press Ctrl+C in the terminal to stop.")
+        # Harvested-only jobs stay eligible for a later apply run
+        seen = load_seen_ids(conn, None if metadata_only else "metadata")
+
+        try:
+            while True:
+                try:
+                    if metadata_only:
+                        harvested = 0
+                        for card in read_job_card_metadata(page):
+                            job_id = card["id"]
+                            if not job_id or job_id in seen or not card["title"]:
+                                continue
+                            record_job(
+                                conn,
+                                job_id,
+                                {
+                                    "status": "metadata",
+                                    "title": card["title"],
+                                    "company": card["company"],
+                                    "url": card["href"],
+                                    "updated_at": now_iso(),
+                                },
+                            )
+                            seen.add(job_id)
+                            harvested += 1
+                        if harvested:
+                            print(f"Saved metadata for {harvested} jobs")
+                        scroll_results(page)
                         continue
 
-                    try:
-                        btn.click()
-                    except Exception:
+                    listing = extract_new_job_ids(page)
+                    if not listing["total"]:
+                        print("No job cards found. Make sure the Jobs search results list is visible.")
+                        wait_for_visible(page, _JOB_CARDS_SELECTOR, 3000)
                         continue
 
-                    time.sleep(1)
-                    result = complete_easy_apply(page, behavior, defaults)
-
-                    state["jobs"][job_id] = {
-                        "status": result,
-                        "title": title,
-                        "company": company,
-                        "url": page.url,
-                        "updated_at": now_iso(),
-                    }
-                    save_state(state_path, state)
-                    seen.add(job_id)
-                    if result == "submitted" and refresh_after_submitted:
-                        submitted_since_refresh += 1
-                        if submitted_since_refresh >= int(refresh_after_submitted):
-                            print(f"Refreshing page after {submitted_since_refresh} submissions...")
-                            try:
-                                page.reload(wait_until="domcontentloaded")
-                                time.sleep(2)
-                            except Exception:
-                                pass
-                            submitted_since_refresh = 0
-
-                # Scroll to load more results
-                try:
-                    results_container = get_results_container(page)
-                    if results_container:
-                        results_container.evaluate("(el) => el.scrollBy(0, 1200)")
-                    else:
-                        page.mouse.wheel(0, 1200)
-                except Exception:
-                    page.mouse.wheel(0, 1200)
-                time.sleep(1)
-            except KeyboardInterrupt:
-                print("Stopping...")
-                break
+                    list_locator = page.locator(listing["selector"])
+                    for entry in listing["cards"]:
+                        i = entry["index"]
+                        job_id = entry["id"] or f"idx-{i}-{int(time.time())}"
+                        if job_id in seen:
+                            continue
+                        card = list_locator.nth(i)
+                        if is_recently_applied_card(card, entry["applied_text"]):
+                            record_job(
+                                conn,
+                                job_id,
+                                {
+                                    "status": "skipped_recently_applied",
+                                    "title": None,
+                                    "company": None,
+                                    "url": page.url,
+                                    "updated_at": now_iso(),
+                                },
+                            )
+                            seen.add(job_id)
+                            continue
+
+                        # The list already shows the Easy Apply badge, so other
+                        # jobs can be skipped without opening their details
+                        if skip_cards_without_easy_apply and entry["easy_apply"] is False:
+                            record_job(
+                                conn,
+                                job_id,
+                                {
+                                    "status": "skipped_no_easy_apply",
+                                    "title": None,
+                                    "company": None,
+                                    "url": page.url,
+                                    "updated_at": now_iso(),
+                                },
+                            )
+                            seen.add(job_id)
+                            continue
+
+                        try:
+                            card.scroll_into_view_if_needed(timeout=_ACTION_TIMEOUT_MS)
+                            card.click(timeout=_ACTION_TIMEOUT_MS)
+                        except Exception:
+                            rewind_job_cards(page, i)
+                            continue
+
+                        wait_for_job_details(page, job_id)
+
+                        title, company = get_job_details(page)
+
+                        btn = easy_apply_button(page)
+                        if not btn:
+                            record_job(
+                                conn,
+                                job_id,
+                                {
+                                    "status": "skipped_no_easy_apply",
+                                    "title": title,
+                                    "company": company,
+                                    "url": page.url,
+                                    "updated_at": now_iso(),
+                                },
+                            )
+                            seen.add(job_id)
+                            continue
+
+                        try:
+                            btn.click(timeout=_ACTION_TIMEOUT_MS)
+                        except Exception:
+                            rewind_job_cards(page, i)
+                            continue
+
+                        wait_for_visible(page, "div[role='dialog']", 3000)
+                        result = complete_easy_apply(page, behavior, defaults)
+
+                        record_job(
+                            conn,
+                            job_id,
+                            {
+                                "status": result,
+                                "title": title,
+                                "company": company,
+                                "url": page.url,
+                                "updated_at": now_iso(),
+                            },
+                        )
+                        seen.add(job_id)
+                        if result == "submitted" and refresh_after_submitted:
+                            submitted_since_refresh += 1
+                            if submitted_since_refresh >= int(refresh_after_submitted):
+                                print(f"Refreshing page after {submitted_since_refresh} submissions...")
+                                try:
+                                    page.reload(wait_until="domcontentloaded")
+                                    wait_for_visible(page, _JOB_CARDS_SELECTOR, 5000)
+                                except Exception:
+                                    pass
+                                submitted_since_refresh = 0
+
+                    # Scroll to load more results
+                    scroll_results(page)
+                except KeyboardInterrupt:
+                    print("Stopping...")
+                    break
+        finally:
+            conn.close()
+            try:
+                if profile_dir:
+                    page.context.close()
+                else:
+                    save_storage_state(page.context, storage_path)
+            except Exception:
+                pass
 
 
 if __name__ == "__main__":